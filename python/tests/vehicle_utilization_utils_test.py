@@ -9,6 +9,7 @@ import os
 import sys
 import unittest
 
+from datetime import datetime
 from uuid import UUID
 
 # Sets up an absolute path to the python directory
@@ -34,13 +35,80 @@ class TestVehicleUtilizationUtils(unittest.TestCase):
             (['VEHICLE0008', 'autonomous', '2019-03-11 19:57:37', '2019-03--11 19:58:12', 'vince.charming', 'Team V'], False),
             (['VEHICLE0008', 'autonomous', '2019-03-11 19:58:12', '2019-03-11 19:57:37', 'vince.charming', 'Team V'], False),
             (['VEHICLE0008', 'autonomous', '2019-03-11 19:57:37', '2019-03-11 19:58:12', '', 'Team V'], False),
-            (['VEHICLE0008', 'autonomous', '2019-03-11 19:57:37', '2019-03-11 19:58:12', 'vince.charming', 'V'], False)]
+            (['VEHICLE0008', 'autonomous', '2019-03-11 19:57:37', '2019-03-11 19:58:12', 'vince.charming', 'V'], False),
+            (['VEHICLE0008', 'autonomous', '2019-03-11 19:57:37', '2019-03-11 19:58:12'], False),
+            (['CAR'], False),
+            ([], False)]
         for test_row, result in test_rows_and_results:
             if result:
                 self.assertTrue(v_u_utils.is_valid_row(test_row))
             else:
                 self.assertFalse(v_u_utils.is_valid_row(test_row))
 
+    def test_validate_rows(self):
+        test_rows_and_reason_codes = [
+            (['VEHICLE0008', 'autonomous', '2019-03-11 19:57:37', '2019-03-11 19:58:12', 'vince.charming', 'Team V'],
+             v_u_utils.ROW_VALID),
+            (['vehicleabcd', 'u', 'March 11 2019 7:57pm', '2019-03-11 19:58:12', 'vince', 'team V'],
+             v_u_utils.ROW_VALID),
+            (['VEHICLE008', 'autonomous', '2019-03-11 19:57:37', '2019-03-11 19:58:12', 'vince.charming', 'Team V'],
+             v_u_utils.ROW_INVALID_VEHICLE_ALIAS),
+            (['VEHICLE0008', 'driving', '2019-03-11 19:57:37', '2019-03-11 19:58:12', 'vince.charming', 'Team V'],
+             v_u_utils.ROW_INVALID_VEHICLE_STATE),
+            (['VEHICLE0008', 'autonomous', '', '2019-03-11 19:58:12', 'vince.charming', 'Team V'],
+             v_u_utils.ROW_MISSING_TIME),
+            (['VEHICLE0008', 'autonomous', '2019-03-11 19:57:37', '2019-03-11 19:58:12', '', 'Team V'],
+             v_u_utils.ROW_MISSING_USERNAME),
+            (['VEHICLE0008', 'autonomous', '2019-03-11 19:57:37', '2019-03-11 19:58:12', ' ', 'Team V'],
+             v_u_utils.ROW_VALID),
+            (['VEHICLE0008', 'autonomous', '2019-03-11 19:57:37', '2019-03-11 19:58:12', 'vince.charming', 'abcdef'],
+             v_u_utils.ROW_INVALID_TEAM),
+            (['VEHICLE0008', 'autonomous', '2019-13-11 19:57:37', '2019-03-11 19:58:12', 'vince.charming', 'Team V'],
+             v_u_utils.ROW_INVALID_TIME_FORMAT),
+            (['VEHICLE0008', 'autonomous', '2019-03-11 19:57:37', '99999999999999999999999', 'vince.charming', 'Team V'],
+             v_u_utils.ROW_INVALID_TIME_FORMAT),
+            (['VEHICLE0008', 'autonomous', '2019-03-11 19:58:12', '2019-03-11 19:57:37', 'vince.charming', 'Team V'],
+             v_u_utils.ROW_INVALID_TIME_ORDER),
+            (['VEHICLE0008', 'autonomous', '2019-03-11 19:57:37+00:00', '2019-03-11 19:58:12', 'vince.charming', 'Team V'],
+             v_u_utils.ROW_MIXED_TIMEZONES)]
+        columns = v_u_utils.rows_to_columns([test_row for test_row, _ in test_rows_and_reason_codes])
+        mask, reason_codes, _, _ = v_u_utils.validate_rows(columns)
+        self.assertEqual(reason_codes, [reason_code for _, reason_code in test_rows_and_reason_codes])
+        self.assertEqual(mask, [reason_code == v_u_utils.ROW_VALID for _, reason_code in test_rows_and_reason_codes])
+
+    def test_validate_rows_datetimes(self):
+        columns = v_u_utils.rows_to_columns([
+            ['VEHICLE0008', 'autonomous', '2019-03-11 19:57:37', '2019-03-11 19:58:12', 'vince.charming', 'Team V'],
+            ['VEHICLE0008', 'manual', 'March 11 2019 7:58:12pm', '2019-03-11 20:01:45', 'vince.charming', 'Team V'],
+            ['VEHICLE0008', 'autonomous', '2019-03-11 19:58:12', '2019-03-11 19:57:37', 'vince.charming', 'Team V']])
+        mask, reason_codes, start_datetimes, end_datetimes = v_u_utils.validate_rows(columns)
+        self.assertEqual(start_datetimes, [datetime(2019, 3, 11, 19, 57, 37), datetime(2019, 3, 11, 19, 58, 12), None])
+        self.assertEqual(end_datetimes, [datetime(2019, 3, 11, 19, 58, 12), datetime(2019, 3, 11, 20, 1, 45), None])
+
+    def test_validate_rows_ragged(self):
+        test_rows_and_reason_codes = [
+            (['CAR'], v_u_utils.ROW_INVALID_VEHICLE_ALIAS),
+            (['VEHICLE0008', 'driving'], v_u_utils.ROW_INVALID_VEHICLE_STATE),
+            (['VEHICLE0008', 'autonomous'], v_u_utils.ROW_MISSING_TIME),
+            (['VEHICLE0008', 'autonomous', '2019-03-11 19:57:37', '2019-03-11 19:58:12'],
+             v_u_utils.ROW_MISSING_USERNAME),
+            (['VEHICLE0008', 'autonomous', '2019-03-11 19:57:37', '2019-03-11 19:58:12', 'vince.charming'],
+             v_u_utils.ROW_INVALID_TEAM),
+            (['VEHICLE0008', 'autonomous', '2019-03-11 19:57:37', '2019-03-11 19:58:12', 'vince.charming', 'Team V'],
+             v_u_utils.ROW_VALID)]
+        columns = v_u_utils.rows_to_columns([test_row for test_row, _ in test_rows_and_reason_codes])
+        mask, reason_codes, _, _ = v_u_utils.validate_rows(columns)
+        self.assertEqual(reason_codes, [reason_code for _, reason_code in test_rows_and_reason_codes])
+
+        # Extra sheet columns are dropped
+        self.assertEqual(v_u_utils.rows_to_columns([['VEHICLE0008', 'autonomous', '', '', '', '', 'note']]),
+                         [['VEHICLE0008'], ['autonomous'], [''], [''], [''], ['']])
+
+        # Columns cut short, as zip() would produce, are padded rather than raising
+        mask, reason_codes, _, _ = v_u_utils.validate_rows([['CAR', 'VEHICLE0008'], ['autonomous']])
+        self.assertEqual(reason_codes, [v_u_utils.ROW_INVALID_VEHICLE_ALIAS, v_u_utils.ROW_INVALID_VEHICLE_STATE])
+        self.assertEqual(mask, [False, False])
+
 
 def suite():
     functions_suite = unittest.TestLoader().loadTestsFromTestCase(TestVehicleUtilizationUtils)
@@ -0,0 +1,101 @@
+#
+# Vince Charming (c) 2019
+#
+
+"""
+Benchmarks the throughput of batch row validation against per-row validation
+"""
+
+import argparse
+import logging
+import os
+import sys
+import timeit
+
+from datetime import datetime, timedelta
+from dateutil import parser
+
+# Sets up an absolute path to the python directory
+DIR_PATH = os.path.dirname(os.path.join(os.getcwd(), __file__))
+sys.path.append(os.path.normpath(os.path.join(DIR_PATH, '..')))
+from utils.vehicle_utilization_utils import is_valid_row, rows_to_columns, validate_rows
+
+__author__ = 'vcharming'
+
+STATES = ['autonomous', 'manual', 'parked', 'unknown']
+TEAMS = ['Team A', 'Team B', 'Team C', 'Team D']
+USERNAMES = ['vince.charming', 'jane.doe', 'john.smith', 'alex']
+FIRST_START_TIME = datetime(2019, 3, 11, 8, 0, 0)
+
+
+def baseline_is_valid_row(row):
+    """
+    The per-row validation that is_valid_row() performed before validate_rows() existed.
+    Kept here, without logging, as the baseline to compare against
+    :param row: An array of data. Each element within the row relates to a column
+    :return: A boolean; True if all of the columns passed their respective data validation
+    """
+    if len(row[0]) != 11 or row[0][:7].lower() != 'vehicle':
+        return False
+    elif len(row[1]) < 1 or not (
+        row[1][:1].lower() == 'a' or row[1][:1].lower() == 'm' or row[1][:1].lower() == 'p' or row[1][:1].lower() == 'u'):
+        return False
+    elif row[2] == '' or row[3] == '':
+        return False
+    elif row[4] == '':
+        return False
+    elif len(row[5]) != 6 and row[5][:5].lower() != 'team ':
+        return False
+
+    try:
+        return parser.parse(row[2]) < parser.parse(row[3])
+    except ValueError:
+        return False
+
+
+def build_chunk(num_of_rows):
+    """
+    Builds a chunk of rows with increasing timestamps, where each row's end time is the next
+    row's start time, as in the worksheet. Every tenth row has a misformated vehicle state
+    :param num_of_rows: The number of rows in the chunk
+    :return: An array of rows
+    """
+    rows = []
+    end_time = FIRST_START_TIME.strftime('%Y-%m-%d %H:%M:%S')
+    for row_num in range(num_of_rows):
+        start_time = end_time
+        end_time = (FIRST_START_TIME + timedelta(seconds=37 * (row_num + 1))).strftime('%Y-%m-%d %H:%M:%S')
+        state = 'driving' if row_num % 10 == 9 else STATES[row_num % len(STATES)]
+        rows.append(['VEHICLE{:04d}'.format(row_num % 100), state, start_time, end_time,
+                     USERNAMES[row_num % len(USERNAMES)], TEAMS[row_num % len(TEAMS)]])
+    return rows
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--rows', type=int, default=1000000, help='Number of rows per chunk')
+    arg_parser.add_argument('--repeat', type=int, default=3, help='Number of timed runs; the best is reported')
+    args = arg_parser.parse_args()
+
+    # is_valid_row() logs every misformated row, which would dominate the timing
+    logging.disable(logging.ERROR)
+
+    data = build_chunk(args.rows)
+
+    timings_s = [
+        ('baseline per-row', min(timeit.repeat(
+            lambda: [baseline_is_valid_row(row) for row in data], number=1, repeat=args.repeat))),
+        ('is_valid_row per-row', min(timeit.repeat(
+            lambda: [is_valid_row(row) for row in data], number=1, repeat=args.repeat))),
+        # Starts from rows, as the per-row paths and parse_data_into_dicts() do
+        ('validate_rows batch', min(timeit.repeat(
+            lambda: validate_rows(rows_to_columns(data)), number=1, repeat=args.repeat)))]
+
+    print('Rows per chunk: {}'.format(args.rows))
+    for label, timing_s in timings_s:
+        print('\t{:<22} {:.3f} s ({:.0f} rows/s)'.format(label + ':', timing_s, args.rows / timing_s))
+    return
+
+
+if __name__ == '__main__':
+    main()
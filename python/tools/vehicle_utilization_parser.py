@@ -15,12 +15,11 @@ import pygsheets
 import sys
 import yaml
 
-from dateutil import parser
-
 # Sets up an absolute path to the python directory
 DIR_PATH = os.path.dirname(os.path.join(os.getcwd(), __file__))
 sys.path.append(os.path.normpath(os.path.join(DIR_PATH, '..')))
-from utils.vehicle_utilization_utils import VehicleUtilization, User, Team, Vehicle, is_valid_row, get_avg_transition_per_min
+from utils.vehicle_utilization_utils import VehicleUtilization, User, Team, Vehicle, ROW_ERROR_MESSAGES, \
+    rows_to_columns, validate_rows, get_avg_transition_per_min
 
 __author__ = 'vcharming'
 
@@ -84,9 +83,13 @@ def parse_data_into_dicts(data):
     :return:
     """
 
-    for row_num, row in enumerate(data, 1):
-        if not is_valid_row(row):
-            logger.error('Row {} is misformated. Skipping.'.format(row_num + 1))
+    # Validates every row in one pass over the columns
+    mask, reason_codes, start_datetimes, end_datetimes = validate_rows(rows_to_columns(data))
+
+    for row_num, (row, valid_flag, reason_code, start_time, end_time) in enumerate(
+            zip(data, mask, reason_codes, start_datetimes, end_datetimes), 1):
+        if not valid_flag:
+            logger.error('Row {} is misformated. {} Skipping.'.format(row_num + 1, ROW_ERROR_MESSAGES[reason_code]))
             continue
 
         # a for autonomous
@@ -98,9 +101,7 @@ def parse_data_into_dicts(data):
         #
         # Time
         #
-        # Converts string into datetime object
-        start_time = parser.parse(row[2])
-        end_time = parser.parse(row[3])
+        # Reuses the datetime objects parsed during validation
         delta_time = end_time - start_time
 
         #
@@ -7,8 +7,10 @@ Utilities specific to gathering data regarding vehicle utilization
 """
 
 import logging
+import re
 import uuid
 
+from datetime import datetime
 from dateutil import parser
 from general_utils import is_valid_uuid
 
@@ -127,47 +129,150 @@ class Vehicle(object):
         return
 
 
+# Number of columns in a row: vehicle alias, state, start time, end time, user name, team
+ROW_NUM_OF_COLUMNS = 6
+
+# Reason codes returned by validate_rows(), one per row
+ROW_VALID = 0
+ROW_INVALID_VEHICLE_ALIAS = 1
+ROW_INVALID_VEHICLE_STATE = 2
+ROW_MISSING_TIME = 3
+ROW_MISSING_USERNAME = 4
+ROW_INVALID_TEAM = 5
+ROW_INVALID_TIME_FORMAT = 6
+ROW_INVALID_TIME_ORDER = 7
+ROW_MIXED_TIMEZONES = 8
+
+ROW_ERROR_MESSAGES = {
+    ROW_INVALID_VEHICLE_ALIAS: 'Vehicle alias must be formated as \'VEHICLEXXXX\'.',
+    ROW_INVALID_VEHICLE_STATE: ('Vehicle activity must start with \'a\' for autonomous, '
+                                '\'m\' for manual, \'p\' for parked, or \'u\' for unknown.'),
+    ROW_MISSING_TIME: 'Start and End time are required.',
+    ROW_MISSING_USERNAME: 'User name required.',
+    ROW_INVALID_TEAM: 'Team Name must be formated as \'Team X\'.',
+    ROW_INVALID_TIME_FORMAT: 'Start and End time must be in a valid datetime format.',
+    ROW_INVALID_TIME_ORDER: 'End time must be later than the Start time.',
+    ROW_MIXED_TIMEZONES: 'Start and End time must both include or both omit a timezone.'}
+
+# Compiled once so that validating a chunk does not rebuild them per row
+_VEHICLE_ALIAS_PATTERN = re.compile(r'vehicle.{4}\Z', re.IGNORECASE | re.DOTALL)
+_VEHICLE_STATE_PATTERN = re.compile(r'[ampu]', re.IGNORECASE)
+_TEAM_PATTERN = re.compile(r'team \S', re.IGNORECASE)
+# The format the worksheet exports, e.g. 2019-03-11 19:57:37
+_TIMESTAMP_PATTERN = re.compile(r'(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2})\Z')
+
+
+def _parse_timestamp(timestamp):
+    """
+    Converts a timestamp string into a datetime object
+    :param timestamp: A timestamp string
+    :return: A datetime object. Raises ValueError or OverflowError if the string is not a valid datetime
+    """
+    # Building the datetime from the pattern is much cheaper than dateutil for the common worksheet format
+    match = _TIMESTAMP_PATTERN.match(timestamp)
+    if match:
+        return datetime(*[int(field) for field in match.groups()])
+    return parser.parse(timestamp)
+
+
+def rows_to_columns(rows):
+    """
+    Transposes a chunk of rows into the columns validate_rows() expects
+    :param rows: An array of rows. Rows may be missing trailing cells
+    :return: An array of ROW_NUM_OF_COLUMNS columns. Missing cells are filled with '' and any
+             extra cells are dropped
+    """
+    return [[row[column_num] if column_num < len(row) else '' for row in rows]
+            for column_num in range(ROW_NUM_OF_COLUMNS)]
+
+
+def validate_rows(columns):
+    """
+    Ensures the data in a chunk of rows matches the format requirements for each column
+    :param columns: An array of columns. Each column is an array holding one value per row,
+                    in the order: vehicle alias, state, start time, end time, user name, team.
+                    Short or missing columns are padded with ''
+    :return: A tuple of (mask, reason_codes, start_datetimes, end_datetimes). mask is an array of
+             booleans; True if the row passed all of its data validation. reason_codes is an array
+             of ROW_* codes. start_datetimes and end_datetimes hold the parsed start and end time
+             of each valid row, or None for an invalid row
+    """
+    # Missing cells are treated as empty so a short row fails validation instead of raising
+    columns = list(columns[:ROW_NUM_OF_COLUMNS])
+    num_of_rows = max([0] + [len(column) for column in columns])
+    for column_num, column in enumerate(columns):
+        if len(column) < num_of_rows:
+            columns[column_num] = list(column) + [''] * (num_of_rows - len(column))
+    columns += [[''] * num_of_rows] * (ROW_NUM_OF_COLUMNS - len(columns))
+    vehicle_aliases, states, start_times, end_times, usernames, teams = columns
+
+    match_vehicle_alias = _VEHICLE_ALIAS_PATTERN.match
+    match_vehicle_state = _VEHICLE_STATE_PATTERN.match
+    match_team = _TEAM_PATTERN.match
+
+    # Timestamps already parsed within this chunk
+    parsed_timestamps = {}
+
+    mask = []
+    reason_codes = []
+    start_datetimes = []
+    end_datetimes = []
+    for vehicle_alias, state, start_time, end_time, username, team in zip(
+            vehicle_aliases, states, start_times, end_times, usernames, teams):
+        if not match_vehicle_alias(vehicle_alias):
+            reason_code = ROW_INVALID_VEHICLE_ALIAS
+        elif not match_vehicle_state(state):
+            reason_code = ROW_INVALID_VEHICLE_STATE
+        elif start_time == '' or end_time == '':
+            reason_code = ROW_MISSING_TIME
+        elif username == '':
+            reason_code = ROW_MISSING_USERNAME
+        elif not match_team(team):
+            reason_code = ROW_INVALID_TEAM
+        else:
+            try:
+                # One row's end time is usually the next row's start time
+                try:
+                    start_datetime = parsed_timestamps[start_time]
+                except KeyError:
+                    start_datetime = parsed_timestamps[start_time] = _parse_timestamp(start_time)
+                try:
+                    end_datetime = parsed_timestamps[end_time]
+                except KeyError:
+                    end_datetime = parsed_timestamps[end_time] = _parse_timestamp(end_time)
+
+                if start_datetime >= end_datetime:
+                    reason_code = ROW_INVALID_TIME_ORDER
+                else:
+                    reason_code = ROW_VALID
+            except (ValueError, OverflowError):
+                reason_code = ROW_INVALID_TIME_FORMAT
+            except TypeError:
+                # Comparing a timezone-aware datetime with a naive one
+                reason_code = ROW_MIXED_TIMEZONES
+
+        if reason_code != ROW_VALID:
+            start_datetime = end_datetime = None
+
+        mask.append(reason_code == ROW_VALID)
+        reason_codes.append(reason_code)
+        start_datetimes.append(start_datetime)
+        end_datetimes.append(end_datetime)
+
+    return mask, reason_codes, start_datetimes, end_datetimes
+
+
 def is_valid_row(row):
     """
     Ensures the data in the given row matches its format requirements for that column
     :param row: An array of data. Each element within the row relates to a column
     :return: A boolean; True if all of the columns passed their respective data validation
     """
+    mask, reason_codes, _, _ = validate_rows(rows_to_columns([row]))
 
-    valid_flag = True
-
-    if len(row[0]) != 11 or row[0][:7].lower() != 'vehicle':
-        error_message = 'Vehicle alias must be formated as \'VEHICLEXXXX\'.'
-        valid_flag = False
-    elif len(row[1]) < 1 or not (
-        row[1][:1].lower() == 'a' or row[1][:1].lower() == 'm' or row[1][:1].lower() == 'p' or row[1][:1].lower() == 'u'):
-        error_message = ('Vehicle activity must start with \'a\' for autonomous, '
-                         '\'m\' for manual, \'p\' for parked, or \'u\' for unknown.')
-        valid_flag = False
-    elif row[2] == '' or row[3] == '':
-        error_message = 'Start and End time are required.'
-        valid_flag = False
-    elif row[4] == '':
-        error_message = 'User name required.'
-        valid_flag = False
-    elif len(row[5]) != 6 and row[5][:5].lower() != 'team ':
-        error_message = 'Team Name must be formated as \'Team X\'.'
-        valid_flag = False
-
-    if valid_flag:
-        try:
-            start_time = parser.parse(row[2])
-            end_time = parser.parse(row[3])
-            if start_time >= end_time:
-                error_message = 'End time must be later than the Start time.'
-                valid_flag = False
-        except ValueError:
-            error_message = 'Start and End time must be in a valid datetime format.'
-            valid_flag = False
-
-    if not valid_flag:
-        logging.error('{}'.format(error_message))
-    return valid_flag
+    if not mask[0]:
+        logging.error('{}'.format(ROW_ERROR_MESSAGES[reason_codes[0]]))
+    return mask[0]
 
 
 def get_avg_transition_per_min(users):